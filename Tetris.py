@@ -37,14 +37,27 @@ Tetris — 单文件完整版（Pygame）
   python tetris.py
 """
 from __future__ import annotations
-import sys, os, json, math, random, time
+import sys, os, json, math, random, time, threading
+from functools import lru_cache
 import pygame
+try:  # 可选：用于一次性向量化生成渐变背景，缺失时退回逐行绘制
+    import numpy as np
+except ImportError:
+    np = None
 
 # ===================== 常量与配置 ===================== #
 CELL = 32              # 单元格像素尺寸
 COLS, ROWS = 10, 22    # 行列（包含 2 行隐藏行）
 VISIBLE_ROWS = 20
 HIDDEN_ROWS = ROWS - VISIBLE_ROWS
+# 位棋盘：第 c 列对应第 c+WALL_PAD 位，两侧各 WALL_PAD 位恒为 1 充当墙体，
+# 底部另加 FLOOR_ROWS 行全 1 充当地板，越界即自然碰撞，无需逐格边界判断。
+# 踢墙每次最多位移 2 列/2 行，4 位（行）足以兜住所有候选位置。
+WALL_PAD = 4
+FLOOR_ROWS = 4
+FIELD_MASK = ((1 << COLS) - 1) << WALL_PAD          # 场地部分
+FULL_MASK = (1 << (COLS + 2 * WALL_PAD)) - 1        # 一行占满（含墙）
+EMPTY_ROW = FULL_MASK & ~FIELD_MASK                 # 空行（只有墙）
 
 PANEL_W = 260          # 右侧信息面板宽度
 MARGIN = 20            # 外边距
@@ -52,15 +65,34 @@ GRID_W = COLS * CELL
 GRID_H = VISIBLE_ROWS * CELL
 WIN_W = GRID_W + PANEL_W + MARGIN * 3
 WIN_H = GRID_H + MARGIN * 2
+# 脏矩形分区：左侧 = 背景 + 主网格 + 顶部 HIGH，右侧 = 信息面板内容
+FIELD_RECT = pygame.Rect(0, 0, GRID_W + MARGIN * 2, WIN_H)
+PANEL_RECT = pygame.Rect(FIELD_RECT.right, 0, WIN_W - FIELD_RECT.right, WIN_H)
 FPS = 60
+IDLE_FPS = 20          # 暂停/结束画面静止，降低轮询与重绘频率
+MAX_DT = 0.05          # 单帧 dt 上限（秒）：卡顿后不让重力/ARR 一次跳太多
 
 # 锁定延迟（秒）及最大重置次数（Guideline 常见 0.5s, 15 次）
 LOCK_DELAY = 0.5
 LOCK_RESETS_MAX = 15
 
 # 字体（运行时动态匹配中文字体，避免乱码）
-FONT_PATH = None  # 在 main() 中初始化
-FONT_CACHE = {}
+FONT_PATH = None  # 在 main() 中初始化；get_font 的缓存依赖它在首次取字体前设定
+# 已渲染文字表面：(text, size, color) -> Surface；按最近使用淘汰（dict 保持插入顺序）
+TEXT_CACHE = {}
+TEXT_CACHE_MAX = 128
+
+# 预渲染表面（convert 需要显示模式，在 main() 中 set_mode 之后初始化）
+STATIC_SURFACES = {}
+CELL_SURFACES = {}     # kind -> 实心方块
+GHOST_SURFACES = {}    # kind -> 影子描边
+CELL_LUT = []          # KIND_IDS 值 -> 实心方块（下标 0 为 None），绘制棋盘时免去字典查找
+MINI_SURFACES = {}     # (kind|None, highlight) -> HOLD/NEXT 缩略图（含底板）
+MINI_W, MINI_H = 96, 64
+PROGRESS_SURFACES = [] # have(0..9) -> 等级进度条填充段（0 为 None）
+BAR_W, BAR_H = PANEL_W-32, 14
+# pygame-ce 2.1.4+ 提供 fblits（C 层批量 blit）；原版 pygame 退回 blits
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
 
 # 颜色（RGB）
 WHITE = (245, 245, 245)
@@ -80,6 +112,8 @@ PIECE_COLORS = {
     'T': (180, 100, 220),
     'Z': (220, 80, 100),
 }
+# 棋盘格内用整数编号记录 kind：0 为空，1..7 依 PIECE_COLORS 顺序（用作 CELL_LUT 下标）
+KIND_IDS = {k: i + 1 for i, k in enumerate(PIECE_COLORS)}
 
 # ===================== 形状与旋转（SRS 4x4） ===================== #
 # 每个旋转状态是 4x4 字符矩阵，'X' 表示占用，'.' 表示空
@@ -269,6 +303,29 @@ SHAPES = {
     ],
 }
 
+# 导入时预计算，热路径不再解析 4x4 字符矩阵：
+# PIECE_CELLS[kind][rot] = ((dx,dy), ...) 占用格相对坐标
+# PIECE_MASKS[kind][rot] = 4 行掩码（x=0 时，第 c 列对应 1<<c）
+# PIECE_PIXELS[kind][rot] = ((dx*CELL, dy*CELL, dy), ...) 绘制用像素偏移（dy 供可见性裁剪）
+PIECE_CELLS = {}
+PIECE_MASKS = {}
+PIECE_PIXELS = {}
+for _kind, _rots in SHAPES.items():
+    PIECE_CELLS[_kind] = []
+    PIECE_MASKS[_kind] = []
+    for _s in _rots:
+        _cells = tuple((i % 4, i // 4) for i in range(16) if _s[i] == 'X')
+        _masks = [0, 0, 0, 0]
+        for _dx, _dy in _cells:
+            _masks[_dy] |= 1 << _dx
+        PIECE_CELLS[_kind].append(_cells)
+        PIECE_MASKS[_kind].append(tuple(_masks))
+    # 冻结为元组：只读，且按 rot 索引比列表略快
+    PIECE_CELLS[_kind] = tuple(PIECE_CELLS[_kind])
+    PIECE_MASKS[_kind] = tuple(PIECE_MASKS[_kind])
+    PIECE_PIXELS[_kind] = tuple(tuple((_dx*CELL, _dy*CELL, _dy) for _dx, _dy in _cells)
+                                for _cells in PIECE_CELLS[_kind])
+
 # SRS 墙踢 (JLSTZ 与 I) — 每组表示从状态 from->to 应用的位移列表
 JLSTZ_KICKS = {
     (0,1): [(0,0), (-1,0), (-1, -1), (0, 2), (-1, 2)],
@@ -290,6 +347,17 @@ I_KICKS = {
     (3,0): [(0,0), (1,0), (-2,0), (1, -2), (-2, 1)],
     (0,3): [(0,0), (-1,0), (2,0), (-1, 2), (2, -1)],
 }
+# 扁平化为按 frm*4+to 索引的元组表，旋转时免去字典哈希；无定义的组合只试原位
+JLSTZ_KICK_TABLE = [((0,0),)] * 16
+I_KICK_TABLE = [((0,0),)] * 16
+for (_f, _t), _v in JLSTZ_KICKS.items():
+    JLSTZ_KICK_TABLE[_f*4 + _t] = tuple(_v)
+for (_f, _t), _v in I_KICKS.items():
+    I_KICK_TABLE[_f*4 + _t] = tuple(_v)
+JLSTZ_KICK_TABLE = tuple(JLSTZ_KICK_TABLE)
+I_KICK_TABLE = tuple(I_KICK_TABLE)
+# 180° 旋转的位移尝试（非官方表，但实用）
+KICKS_180 = ((0,0),(1,0),(-1,0),(0,1),(0,-1),(2,0),(-2,0))
 
 # ===================== 工具函数 ===================== #
 
@@ -318,17 +386,24 @@ def match_cjk_font()->str:
     return pygame.font.get_default_font()
 
 
+@lru_cache(maxsize=16)  # UI 只用到少数几个字号；命中时在 C 层返回，不进函数体
 def get_font(size:int):
-    key = int(size)
-    f = FONT_CACHE.get(key)
-    if f:
-        return f
     try:
-        f = pygame.font.Font(FONT_PATH, size)
+        return pygame.font.Font(FONT_PATH, size)
     except Exception:
-        f = pygame.font.Font(None, size)
-    FONT_CACHE[key] = f
-    return f
+        return pygame.font.Font(None, size)
+
+def render_text(text:str, size:int, color)->pygame.Surface:
+    # font.render 较慢：静态标签只渲染一次，分数等变化的数字按 LRU 缓存
+    key = (text, size, color)
+    surf = TEXT_CACHE.pop(key, None)
+    if surf is None:
+        # 转成与显示相同的像素格式，blit 走 SDL 快速路径（需在 set_mode 之后调用）
+        surf = get_font(size).render(text, True, color).convert_alpha()
+        if len(TEXT_CACHE) >= TEXT_CACHE_MAX:
+            del TEXT_CACHE[next(iter(TEXT_CACHE))]
+    TEXT_CACHE[key] = surf
+    return surf
 
 # 重力间隔（秒）：随等级递减
 # 近似 Guideline 重力：interval = max(0.05, 0.8 * (0.85 ** (level-1)))
@@ -349,6 +424,9 @@ SCORE_TABLE = {
 
 # ===================== 数据结构 ===================== #
 class Piece:
+    # 固定属性集，免去每个实例的 __dict__
+    __slots__ = ('kind', 'rot', 'x', 'y', 'last_action', 'lock_resets')
+
     def __init__(self, kind:str):
         self.kind = kind
         self.rot = 0  # 0,1,2,3
@@ -361,27 +439,6 @@ class Piece:
         self.last_action = None  # 'move' | 'rotate' | None
         self.lock_resets = 0
 
-    def shape(self):
-        return SHAPES[self.kind][self.rot]
-
-    def cells(self):
-        # 返回当前 4x4 矩阵中为 X 的绝对坐标
-        s = self.shape()
-        out = []
-        for i in range(16):
-            if s[i] == 'X':
-                r, c = i // 4, i % 4
-                out.append((self.x + c, self.y + r))
-        return out
-
-    def clone(self):
-        p = Piece(self.kind)
-        p.rot = self.rot
-        p.x, p.y = self.x, self.y
-        p.last_action = self.last_action
-        p.lock_resets = self.lock_resets
-        return p
-
 # 7-袋随机器
 class Bag:
     def __init__(self):
@@ -409,46 +466,86 @@ class Queue:
         self.items.append(self.bag.pop())
         return n
 
-    def peek_list(self):
-        return self.items[:self.preview]
+    def peek_list(self)->tuple:
+        # 只读快照，调用方直接迭代
+        return tuple(self.items[:self.preview])
 
 # 棋盘（包含隐藏行）
 class Board:
     def __init__(self):
-        # 使用整数标记：0 表空；其它使用字符保存 kind
-        self.grid = [['.' for _ in range(COLS)] for _ in range(ROWS)]
-
-    def inside(self, x, y):
-        return 0 <= x < COLS and y < ROWS
+        # 位棋盘：每行一个整数（含墙位），末尾 FLOOR_ROWS 行为地板
+        self.rows = [EMPTY_ROW] * ROWS + [FULL_MASK] * FLOOR_ROWS
+        # 并行保存每格的 kind 编号（仅用于着色，见 KIND_IDS），0 表空
+        self.grid = [[0] * COLS for _ in range(ROWS)]
+        self.version = 0  # 锁定/消行时递增，供绘制判断是否需要重画
 
     def collide(self, piece:Piece)->bool:
-        for x, y in piece.cells():
-            if y < 0:
-                # 允许在隐藏区
-                continue
-            if not self.inside(x, y) or self.grid[y][x] != '.':
+        return self.collide_at(piece.kind, piece.rot, piece.x, piece.y)
+
+    def collide_at(self, kind:str, rot:int, x:int, y:int)->bool:
+        # 无需构造 Piece 即可测试任意位置
+        m0, m1, m2, m3 = PIECE_MASKS[kind][rot]
+        s = x + WALL_PAD
+        rows = self.rows
+        if y >= 0:
+            # 墙/地板已编码进行掩码：4 次 AND，无分支
+            return ((rows[y] & (m0 << s)) | (rows[y+1] & (m1 << s))
+                    | (rows[y+2] & (m2 << s)) | (rows[y+3] & (m3 << s))) != 0
+        # 方块上部位于棋盘之上（隐藏区以上）：那里只有墙
+        for r, m in enumerate((m0, m1, m2, m3)):
+            row = rows[y + r] if y + r >= 0 else EMPTY_ROW
+            if row & (m << s):
                 return True
         return False
 
+    def drop_y(self, kind:str, rot:int, x:int, y:int)->int:
+        # 从 (x, y) 垂直下探到最低可停位置：掩码只移位一次，循环内只剩索引与 AND
+        collide_at = self.collide_at
+        while y < 0:
+            if collide_at(kind, rot, x, y + 1):
+                return y
+            y += 1
+        m0, m1, m2, m3 = PIECE_MASKS[kind][rot]
+        s = x + WALL_PAD
+        m0 <<= s; m1 <<= s; m2 <<= s; m3 <<= s
+        rows = self.rows
+        # 地板行全 1，循环必然终止
+        while not ((rows[y+1] & m0) | (rows[y+2] & m1) | (rows[y+3] & m2) | (rows[y+4] & m3)):
+            y += 1
+        return y
+
     def lock(self, piece:Piece):
-        for x, y in piece.cells():
+        # 直接遍历预计算的相对坐标
+        px, py, kind = piece.x, piece.y, piece.kind
+        kid = KIND_IDS[kind]
+        rows, grid = self.rows, self.grid
+        self.version += 1
+        for dx, dy in PIECE_CELLS[kind][piece.rot]:
+            x, y = px + dx, py + dy
             if 0 <= y < ROWS and 0 <= x < COLS:
-                self.grid[y][x] = piece.kind
+                rows[y] |= 1 << (x + WALL_PAD)
+                grid[y][x] = kid
 
-    def clear_lines(self):
+    def clear_lines(self, y0:int=0, y1:int=ROWS):
         # 返回（消行数，被清除的行索引列表）
-        full = [i for i in range(ROWS) if all(c != '.' for c in self.grid[i])]
-        for i in full:
-            del self.grid[i]
-            self.grid.insert(0, ['.' for _ in range(COLS)])
+        # 只有刚锁定方块所在的行 [y0, y1) 可能变满，其余行无需检查
+        rows, grid = self.rows, self.grid
+        lo, hi = max(0, y0), min(ROWS, y1)
+        full = [i for i in range(lo, hi) if rows[i] == FULL_MASK]
+        if full:
+            # 只在 [lo, hi) 内过滤满行，其余部分整段切片拼接（C 层复制），顶部补入空行；
+            # rows[hi:] 含地板行，保持不动
+            n = len(full)
+            kept = [i for i in range(lo, hi) if rows[i] != FULL_MASK]
+            self.rows = [EMPTY_ROW] * n + rows[:lo] + [rows[i] for i in kept] + rows[hi:]
+            self.grid = ([[0] * COLS for _ in range(n)]
+                         + grid[:lo] + [grid[i] for i in kept] + grid[hi:])
+            self.version += 1
         return len(full), full
 
     def topped_out(self):
-        # 任何在隐藏行内的占用算作顶出
-        for y in range(HIDDEN_ROWS):
-            if any(self.grid[y][x] != '.' for x in range(COLS)):
-                return True
-        return False
+        # 任何在隐藏行内的占用算作顶出（HIDDEN_ROWS == 2：两行按位或即可）
+        return (self.rows[0] | self.rows[1]) & FIELD_MASK != 0
 
 # ===================== 旋转与墙踢 ===================== #
 
@@ -463,12 +560,11 @@ def rotate_with_kick(board:Board, piece:Piece, dir:int)->bool:
         piece.last_action = 'rotate'
         return True
 
-    if dir == 2:  # 180° 旋转：采用简单碰撞 + 小范围位移尝试（非官方表，但实用）
+    if dir == 2:  # 180° 旋转：采用简单碰撞 + 小范围位移尝试（见 KICKS_180）
         target = (piece.rot + 2) % 4
-        kicks = [(0,0),(1,0),(-1,0),(0,1),(0,-1),(2,0),(-2,0)]
         old_rot = piece.rot
         piece.rot = target
-        for dx, dy in kicks:
+        for dx, dy in KICKS_180:
             piece.x += dx; piece.y += dy
             if not board.collide(piece):
                 piece.last_action = 'rotate'
@@ -479,10 +575,10 @@ def rotate_with_kick(board:Board, piece:Piece, dir:int)->bool:
 
     frm = piece.rot
     to = (piece.rot + dir) % 4
-    kicks = I_KICKS if piece.kind == 'I' else JLSTZ_KICKS
+    kicks = (I_KICK_TABLE if piece.kind == 'I' else JLSTZ_KICK_TABLE)[frm*4 + to]
     oldx, oldy, oldrot = piece.x, piece.y, piece.rot
     piece.rot = to
-    for dx, dy in kicks.get((frm, to), [(0,0)]):
+    for dx, dy in kicks:
         piece.x = oldx + dx
         piece.y = oldy + dy
         if not board.collide(piece):
@@ -493,6 +589,14 @@ def rotate_with_kick(board:Board, piece:Piece, dir:int)->bool:
     return False
 
 # ===================== T-Spin 判定 ===================== #
+# 相对 T 中心的四角偏移，以及各朝向的前侧两角（导入时算好，判定时免建字典）
+T_CORNERS = ((-1,-1), (1,-1), (-1,1), (1,1))
+T_FRONT = (
+    ((-1,-1), (1,-1)),   # 0 上
+    ((1,-1), (1,1)),     # 1 右
+    ((-1,1), (1,1)),     # 2 下
+    ((-1,-1), (-1,1)),   # 3 左
+)
 
 def is_tspin(board:Board, piece:Piece, lines:int, last_action:str):
     """返回 (is_tspin, is_mini)
@@ -503,43 +607,161 @@ def is_tspin(board:Board, piece:Piece, lines:int, last_action:str):
         return (False, False)
     # 以当前 piece 定位中心
     cx, cy = piece.x + 1, piece.y + 1
-    corners = [(cx-1, cy-1), (cx+1, cy-1), (cx-1, cy+1), (cx+1, cy+1)]
+    grid = board.grid
     occupied = 0
-    for x, y in corners:
+    for dx, dy in T_CORNERS:
+        x, y = cx + dx, cy + dy
         if not (0 <= x < COLS and 0 <= y < ROWS):
             occupied += 1
-        elif board.grid[y][x] != '.':
+        elif grid[y][x]:
             occupied += 1
     if occupied < 3:
         return (False, False)
     # 迷你判定：基于前侧两个角被占用与旋转朝向（简化）
-    # 旋转朝向 0(上)1(右)2(下)3(左)，检测前两个脚位
-    front = {
-        0: [(cx-1, cy-1), (cx+1, cy-1)],
-        1: [(cx+1, cy-1), (cx+1, cy+1)],
-        2: [(cx-1, cy+1), (cx+1, cy+1)],
-        3: [(cx-1, cy-1), (cx-1, cy+1)],
-    }[piece.rot]
+    # 旋转朝向 0(上)1(右)2(下)3(左)，检测前两个脚位（见 T_FRONT）
     focc = 0
-    for x, y in front:
+    for dx, dy in T_FRONT[piece.rot]:
+        x, y = cx + dx, cy + dy
         if not (0 <= x < COLS and 0 <= y < ROWS):
             focc += 1
-        elif board.grid[y][x] != '.':
+        elif grid[y][x]:
             focc += 1
     is_mini = (focc == 1) and (lines == 1)
     return (True, is_mini)
 
+# ===================== 预渲染缓存 ===================== #
+
+def render_bg_gradient()->pygame.Surface:
+    # 简单线性渐变背景（只在启动时画一次）
+    surf = pygame.Surface((WIN_W, WIN_H)).convert()
+    top = (26, 28, 36)
+    bottom = (14, 16, 22)
+    if np is not None:
+        # 与下方逐行算法逐像素一致：先算每行颜色 (H,3)，再铺满整宽写入表面
+        t = np.arange(WIN_H) / float(WIN_H-1)
+        a, b = np.array(top, dtype=float), np.array(bottom, dtype=float)
+        col = (a + (b - a) * t[:, None]).astype(np.uint8)
+        pygame.surfarray.blit_array(surf, np.repeat(col[None, :, :], WIN_W, axis=0))
+        return surf
+    for i in range(WIN_H):
+        t = i / float(WIN_H-1)
+        c = (
+            int(lerp(top[0], bottom[0], t)),
+            int(lerp(top[1], bottom[1], t)),
+            int(lerp(top[2], bottom[2], t)),
+        )
+        pygame.draw.line(surf, c, (0,i), (WIN_W, i))
+    return surf
+
+def render_grid()->pygame.Surface:
+    # 主网格底板（圆角面板 + 背景小方格），以 (MARGIN-6, MARGIN-6) 为原点
+    surf = pygame.Surface((GRID_W+12, GRID_H+12), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(surf, PANEL_BG, surf.get_rect(), border_radius=18)
+    gx, gy = 6, 6
+    for r in range(VISIBLE_ROWS+1):
+        y = gy + r*CELL
+        pygame.draw.line(surf, GRID_LINE, (gx, y), (gx + GRID_W, y))
+    for c in range(COLS+1):
+        x = gx + c*CELL
+        pygame.draw.line(surf, GRID_LINE, (x, gy), (x, gy + GRID_H))
+    return surf
+
+def render_panel()->pygame.Surface:
+    # 侧边面板底板 + 进度条底槽，以 (px-6, py-6) 为原点
+    surf = pygame.Surface((PANEL_W+12, GRID_H+12), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(surf, PANEL_BG, surf.get_rect(), border_radius=18)
+    pygame.draw.rect(surf, (50,54,63), (22, 186, BAR_W, BAR_H), border_radius=8)
+    return surf
+
+def render_progress(have:int):
+    # 进度条填充段：have/10 的宽度，圆角与底槽一致
+    w = int(BAR_W * (have / 10))
+    if w <= 0:
+        return None
+    surf = pygame.Surface((w, BAR_H), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(surf, ACCENT, surf.get_rect(), border_radius=8)
+    return surf
+
+def render_cell(color, ghost=False)->pygame.Surface:
+    # 圆角 + 高光；画在透明底上，圆角外露出背景
+    surf = pygame.Surface((CELL, CELL), pygame.SRCALPHA).convert_alpha()
+    if ghost:
+        # 影子：描边（原先直接画在屏幕上 alpha 分量被忽略，这里保持同样的实色效果）
+        pygame.draw.rect(surf, color, (3, 3, CELL-6, CELL-6), width=2, border_radius=8)
+        return surf
+    base = color
+    pygame.draw.rect(surf, base, (2, 2, CELL-4, CELL-4), border_radius=8)
+    # 高光
+    hi = (min(255, int(base[0]*1.15)), min(255, int(base[1]*1.15)), min(255, int(base[2]*1.15)))
+    lo = (int(base[0]*0.65), int(base[1]*0.65), int(base[2]*0.65))
+    pygame.draw.rect(surf, hi, (4, 4, CELL-8, (CELL-8)//2), border_radius=6)
+    pygame.draw.rect(surf, lo, (4, CELL//2, CELL-8, (CELL-8)//2), border_radius=6)
+    return surf
+
+def render_mini(kind, highlight=False)->pygame.Surface:
+    # HOLD/NEXT 缩略图：圆角底板（可选高亮描边）+ 居中的 0 朝向方块
+    surf = pygame.Surface((MINI_W, MINI_H), pygame.SRCALPHA).convert_alpha()
+    rect = surf.get_rect()
+    pygame.draw.rect(surf, (36,40,48), rect, border_radius=10)
+    if highlight:
+        pygame.draw.rect(surf, (80,86,96), rect, width=2, border_radius=10)
+    if not kind:
+        return surf
+    # 画 4x4 缩略图
+    coords = [(r, c) for c, r in PIECE_CELLS[kind][0]]
+    # 计算居中缩放：mini cell
+    mini = 16
+    # 求其最小包围盒
+    minr=min(r for r,c in coords); maxr=max(r for r,c in coords)
+    minc=min(c for r,c in coords); maxc=max(c for r,c in coords)
+    w=(maxc-minc+1)*mini; h=(maxr-minr+1)*mini
+    ox = (rect.w - w)//2
+    oy = (rect.h - h)//2
+    col = PIECE_COLORS[kind]
+    for r,c in coords:
+        px = ox + (c - minc)*mini
+        py = oy + (r - minr)*mini
+        pygame.draw.rect(surf, col, (px+2, py+2, mini-4, mini-4), border_radius=5)
+    return surf
+
+def blit_batch(screen, seq):
+    # 一次 C 层调用提交整批 (表面, 位置)
+    if HAS_FBLITS:
+        screen.fblits(seq)
+    else:
+        screen.blits(seq, doreturn=False)
+
+def init_surfaces():
+    STATIC_SURFACES['bg'] = render_bg_gradient()
+    STATIC_SURFACES['grid'] = render_grid()
+    STATIC_SURFACES['panel'] = render_panel()
+    PROGRESS_SURFACES[:] = [render_progress(have) for have in range(10)]
+    # 清行闪烁遮罩：纯白不透明表面，绘制时只改整面 alpha
+    overlay = pygame.Surface((GRID_W, GRID_H)).convert()
+    overlay.fill((255, 255, 255))
+    STATIC_SURFACES['clear_overlay'] = overlay
+    for kind, color in PIECE_COLORS.items():
+        CELL_SURFACES[kind] = render_cell(color)
+        GHOST_SURFACES[kind] = render_cell(color, ghost=True)
+    CELL_LUT[:] = [None] + [CELL_SURFACES[kind] for kind in PIECE_COLORS]
+    for kind in (None, *PIECE_COLORS):
+        for highlight in (False, True):
+            MINI_SURFACES[(kind, highlight)] = render_mini(kind, highlight)
+
 # ===================== 游戏主控 ===================== #
 class Game:
-    def __init__(self):
+    def __init__(self, high:int=0):
         self.board = Board()
         self.queue = Queue(preview=2)
         self.hold = None
         self.hold_used = False
         self.cur = Piece(self.queue.next())
-        self.ghost_y = self.compute_ghost_y()
+        # 影子位置缓存：仅在方块移动/旋转/生成/暂存后失效
+        self._ghost_y = 0
+        self._ghost_dirty = True
 
         self.score = 0
+        self.high = high  # max(历史最高分, 本局分数)，只在分数变化处更新
         self.lines = 0
         self.level = 1
         self.combo = -1
@@ -548,6 +770,7 @@ class Game:
         self.drop_distance_hard = 0
 
         self.gravity_timer = 0.0
+        self.gravity = gravity_interval(self.level)  # 仅在升级时重算
         self.lock_timer = None
         self.running = True
         self.paused = False
@@ -565,16 +788,21 @@ class Game:
         # 立即检测顶出
         if self.board.collide(self.cur):
             self.game_over = True
-        self.ghost_y = self.compute_ghost_y()
+        self._ghost_dirty = True
         self.lock_timer = None
         self.lock_reset_count = 0
 
+    @property
+    def ghost_y(self)->int:
+        if self._ghost_dirty:
+            self._ghost_y = self.compute_ghost_y()
+            self._ghost_dirty = False
+        return self._ghost_y
+
     def compute_ghost_y(self):
-        p = self.cur.clone()
-        while True:
-            p.y += 1
-            if self.board.collide(p):
-                return p.y - 1
+        # 逐行下探（碰撞对下落距离不单调，可能越过悬空处，故不能二分）
+        p = self.cur
+        return self.board.drop_y(p.kind, p.rot, p.x, p.y)
 
     def try_move(self, dx:int, dy:int)->bool:
         oldx, oldy = self.cur.x, self.cur.y
@@ -583,6 +811,7 @@ class Game:
             self.cur.x, self.cur.y = oldx, oldy
             return False
         self.cur.last_action = 'move'
+        self._ghost_dirty = True
         if dy == 0 and self.lock_timer is not None:
             # 地面移动重置锁延迟（有限次数）
             if self.lock_reset_count < LOCK_RESETS_MAX:
@@ -595,7 +824,7 @@ class Game:
             if self.lock_timer is not None and self.lock_reset_count < LOCK_RESETS_MAX:
                 self.lock_timer = 0.0
                 self.lock_reset_count += 1
-            self.ghost_y = self.compute_ghost_y()
+            self._ghost_dirty = True
             return True
         return False
 
@@ -628,7 +857,7 @@ class Game:
             if self.board.collide(self.cur):
                 self.game_over = True
         self.hold_used = True
-        self.ghost_y = self.compute_ghost_y()
+        self._ghost_dirty = True
         self.lock_timer = None
         self.lock_reset_count = 0
 
@@ -640,7 +869,7 @@ class Game:
         self.drop_distance_hard = 0
 
         # 消行 & T-Spin 判定
-        cleared, lines_idx = self.board.clear_lines()
+        cleared, lines_idx = self.board.clear_lines(self.cur.y, self.cur.y + 4)
         tspin, mini = is_tspin(self.board, self.cur, cleared, self.cur.last_action)
 
         line_type = None
@@ -688,7 +917,11 @@ class Game:
         lv_before = self.level
         self.level = 1 + self.lines // 10
         if self.level != lv_before:
-            pass
+            self.gravity = gravity_interval(self.level)
+
+        # 分数只在锁定时变化：顺带更新最高分
+        if self.score > self.high:
+            self.high = self.score
 
         self.spawn()
 
@@ -705,9 +938,8 @@ class Game:
                 self.clear_anim = (idx, t)
 
         # 重力
-        g = gravity_interval(self.level)
+        g = self.gravity
         self.gravity_timer += dt
-        on_ground = self.on_ground()
         if self.gravity_timer >= g:
             self.gravity_timer -= g
             if not self.try_move(0,1):
@@ -727,33 +959,42 @@ class Game:
         else:
             self.lock_timer = None
 
-        self.ghost_y = self.compute_ghost_y()
-
     def on_ground(self)->bool:
-        # 判断向下一格是否碰撞
-        p = self.cur.clone(); p.y += 1
-        return self.board.collide(p)
+        # 向下一格即碰撞 <=> 影子与当前块重合
+        return self.ghost_y == self.cur.y
 
     # ---------- 绘制 ---------- #
+    # 两个分区各自的绘制状态：签名不变则像素不变，可跳过重画与提交
+    # （暂停/结束的居中文字横跨两区，两者都要包含）
+    def field_state(self):
+        p = self.cur
+        return (self.board.version, p.kind, p.rot, p.x, p.y, self.ghost_y,
+                self.clear_anim, self.paused, self.game_over)
+
+    def panel_state(self):
+        return (self.score, self.level, self.lines, self.hold, self.hold_used,
+                self.queue.peek_list(), self.paused, self.game_over)
+
     def draw(self, screen:pygame.Surface):
-        screen.fill(BLACK)
         self.draw_bg_gradient(screen)
         # 网格背景
         gx, gy = MARGIN, MARGIN
-        pygame.draw.rect(screen, PANEL_BG, (gx-6, gy-6, GRID_W+12, GRID_H+12), border_radius=18)
         self.draw_grid(screen, gx, gy)
 
-        # 画锁定的方块
+        # 锁定的方块、影子、当前块：收集后一次性批量 blit
+        blits = []
+        rows, grid = self.board.rows, self.board.grid
+        lut = CELL_LUT
         for y in range(HIDDEN_ROWS, ROWS):
-            for x in range(COLS):
-                k = self.board.grid[y][x]
-                if k != '.':
-                    self.draw_cell(screen, gx + x*CELL, gy + (y-HIDDEN_ROWS)*CELL, PIECE_COLORS[k])
-
-        # 影子
-        self.draw_piece(screen, self.cur, gx, gy, ghost=True)
-        # 当前块
-        self.draw_piece(screen, self.cur, gx, gy, ghost=False)
+            if rows[y] == EMPTY_ROW:
+                continue
+            py = gy + (y-HIDDEN_ROWS)*CELL
+            for x, k in enumerate(grid[y]):
+                if k:
+                    blits.append((lut[k], (gx + x*CELL, py)))
+        self.piece_blits(blits, self.cur, gx, gy, ghost=True)
+        self.piece_blits(blits, self.cur, gx, gy, ghost=False)
+        blit_batch(screen, blits)
 
         # 侧边面板
         px = gx + GRID_W + MARGIN
@@ -767,101 +1008,65 @@ class Game:
             self.draw_center_text(screen, '游戏结束', 44, WHITE, sub='R 重开 / Esc 退出')
 
     def draw_bg_gradient(self, screen):
-        # 简单线性渐变背景
-        top = (26, 28, 36)
-        bottom = (14, 16, 22)
-        for i in range(WIN_H):
-            t = i / float(WIN_H-1)
-            c = (
-                int(lerp(top[0], bottom[0], t)),
-                int(lerp(top[1], bottom[1], t)),
-                int(lerp(top[2], bottom[2], t)),
-            )
-            pygame.draw.line(screen, c, (0,i), (WIN_W, i))
+        # 渐变背景已预渲染，整屏覆盖，无需先 fill
+        screen.blit(STATIC_SURFACES['bg'], (0, 0))
 
     def draw_grid(self, screen, gx, gy):
-        # 背景小方格
-        for r in range(VISIBLE_ROWS+1):
-            y = gy + r*CELL
-            pygame.draw.line(screen, GRID_LINE, (gx, y), (gx + GRID_W, y))
-        for c in range(COLS+1):
-            x = gx + c*CELL
-            pygame.draw.line(screen, GRID_LINE, (x, gy), (x, gy + GRID_H))
-
-    def draw_cell(self, screen, px, py, color, ghost=False):
-        # 圆角 + 高光
-        base = color
-        if ghost:
-            # 影子：淡色边框
-            rect = pygame.Rect(px+3, py+3, CELL-6, CELL-6)
-            pygame.draw.rect(screen, (*color, 48), rect, width=2, border_radius=8)
-            return
-        rect = pygame.Rect(px+2, py+2, CELL-4, CELL-4)
-        pygame.draw.rect(screen, base, rect, border_radius=8)
-        # 高光
-        hi = (min(255, int(base[0]*1.15)), min(255, int(base[1]*1.15)), min(255, int(base[2]*1.15)))
-        lo = (int(base[0]*0.65), int(base[1]*0.65), int(base[2]*0.65))
-        pygame.draw.rect(screen, hi, (px+4, py+4, CELL-8, (CELL-8)//2), border_radius=6)
-        pygame.draw.rect(screen, lo, (px+4, py+CELL//2, CELL-8, (CELL-8)//2), border_radius=6)
-
-    def draw_piece(self, screen, piece:Piece, gx, gy, ghost=False):
+        # 面板与背景小方格已预渲染（见 render_grid）
+        screen.blit(STATIC_SURFACES['grid'], (gx-6, gy-6))
+
+    def piece_blits(self, out, piece:Piece, gx, gy, ghost=False):
+        # 把方块的 (表面, 位置) 追加到 out；方块外观已预渲染（见 render_cell）
         if ghost:
             y = self.ghost_y
+            surf = GHOST_SURFACES[piece.kind]
         else:
             y = piece.y
-        s = SHAPES[piece.kind][piece.rot]
-        for i in range(16):
-            if s[i] == 'X':
-                r, c = i//4, i%4
-                px = gx + (piece.x + c) * CELL
-                py = gy + (y - HIDDEN_ROWS + r) * CELL
-                if py < gy or py >= gy + GRID_H:  # 跳过隐藏区与出界
-                    continue
-                self.draw_cell(screen, px, py, PIECE_COLORS[piece.kind], ghost=ghost)
-
-    def small_text(self, screen, text, x, y, color=MUTED, size=18):
-        font = get_font(size)
-        surf = font.render(text, True, color)
-        screen.blit(surf, (x, y))
-
-    def big_text(self, screen, text, x, y, color=WHITE, size=24):
-        font = get_font(size)
-        surf = font.render(text, True, color)
-        screen.blit(surf, (x, y))
+            surf = CELL_SURFACES[piece.kind]
+        bx = gx + piece.x * CELL
+        by = gy + (y - HIDDEN_ROWS) * CELL
+        for ox, oy, r in PIECE_PIXELS[piece.kind][piece.rot]:
+            if not HIDDEN_ROWS <= y + r < ROWS:  # 跳过隐藏区与出界
+                continue
+            out.append((surf, (bx + ox, by + oy)))
+
+    def small_text(self, out, text, x, y, color=MUTED, size=18):
+        out.append((render_text(text, size, color), (x, y)))
+
+    def big_text(self, out, text, x, y, color=WHITE, size=24):
+        out.append((render_text(text, size, color), (x, y)))
 
     def draw_side_panel(self, screen, px, py):
-        panel_rect = pygame.Rect(px-6, py-6, PANEL_W+12, GRID_H+12)
-        pygame.draw.rect(screen, PANEL_BG, panel_rect, border_radius=18)
+        # 面板内所有元素收集成 (表面, 位置) 序列，最后一次批量 blit
+        # 面板与进度条底槽已预渲染（见 render_panel），每帧不再走圆角绘制
+        out = [(STATIC_SURFACES['panel'], (px-6, py-6))]
         # 标题
-        self.big_text(screen, 'TETRIS', px+16, py+12, ACCENT, 28)
+        self.big_text(out, 'TETRIS', px+16, py+12, ACCENT, 28)
         # 分数/等级/行数
         stat_y = py + 60
-        self.small_text(screen, 'SCORE', px+16, stat_y, MUTED, 16)
-        self.big_text(screen, f"{self.score}", px+16, stat_y+18, WHITE, 26)
-        self.small_text(screen, 'LEVEL', px+16, stat_y+60, MUTED, 16)
-        self.big_text(screen, f"{self.level}", px+16, stat_y+78, WHITE, 26)
-        self.small_text(screen, 'LINES', px+120, stat_y+60, MUTED, 16)
-        self.big_text(screen, f"{self.lines}", px+120, stat_y+78, WHITE, 26)
+        self.small_text(out, 'SCORE', px+16, stat_y, MUTED, 16)
+        self.big_text(out, f"{self.score}", px+16, stat_y+18, WHITE, 26)
+        self.small_text(out, 'LEVEL', px+16, stat_y+60, MUTED, 16)
+        self.big_text(out, f"{self.level}", px+16, stat_y+78, WHITE, 26)
+        self.small_text(out, 'LINES', px+120, stat_y+60, MUTED, 16)
+        self.big_text(out, f"{self.lines}", px+120, stat_y+78, WHITE, 26)
 
         # 进度条：距离下一级
         to_next = (self.level*10) - self.lines
         to_next = max(0, to_next)
         bar_x, bar_y = px+16, stat_y+120
-        bar_w, bar_h = PANEL_W-32, 14
-        pygame.draw.rect(screen, (50,54,63), (bar_x, bar_y, bar_w, bar_h), border_radius=8)
-        need = 10
-        have = self.lines % 10
-        ratio = have / need
-        pygame.draw.rect(screen, ACCENT, (bar_x, bar_y, int(bar_w*ratio), bar_h), border_radius=8)
+        fill = PROGRESS_SURFACES[self.lines % 10]
+        if fill is not None:
+            out.append((fill, (bar_x, bar_y)))
 
         # Hold 区域
         hold_y = bar_y + 28
-        self.small_text(screen, 'HOLD', px+16, hold_y, MUTED, 16)
-        self.draw_mini_mat(screen, self.hold, px+16, hold_y+18, highlight=not self.hold_used)
+        self.small_text(out, 'HOLD', px+16, hold_y, MUTED, 16)
+        self.draw_mini_mat(out, self.hold, px+16, hold_y+18, highlight=not self.hold_used)
 
         # Next 列表（自适应间距，确保 5 个全显示）
         next_y = hold_y + 120
-        self.small_text(screen, 'NEXT', px+16, next_y, MUTED, 16)
+        self.small_text(out, 'NEXT', px+16, next_y, MUTED, 16)
         start_y = next_y + 18
         previews = self.queue.peek_list()
         n = len(previews)
@@ -875,61 +1080,34 @@ class Game:
             spacing = clamp(spacing, 8, 68)
         y = start_y
         for k in previews:
-            self.draw_mini_mat(screen, k, px+16, int(y))
+            self.draw_mini_mat(out, k, px+16, int(y))
             y += spacing
 
         # 帮助
         help_y = py + GRID_H - 120
-        self.small_text(screen, '←/→ 移动  ↓ 软降  Space 硬降', px+16, help_y, MUTED, 14)
-        self.small_text(screen, 'Z/↑/X 旋转  A 180°  C 暂存', px+16, help_y+18, MUTED, 14)
-        self.small_text(screen, 'P 暂停  R 重开', px+16, help_y+36, MUTED, 14)
+        self.small_text(out, '←/→ 移动  ↓ 软降  Space 硬降', px+16, help_y, MUTED, 14)
+        self.small_text(out, 'Z/↑/X 旋转  A 180°  C 暂存', px+16, help_y+18, MUTED, 14)
+        self.small_text(out, 'P 暂停  R 重开', px+16, help_y+36, MUTED, 14)
+        blit_batch(screen, out)
 
         # 清行闪烁覆盖（只覆盖主网格，不影响右侧面板）
         if self.clear_anim is not None:
             idx, t = self.clear_anim
             alpha = int(255 * (t / 0.15))
-            overlay = pygame.Surface((GRID_W, GRID_H), pygame.SRCALPHA)
-            pygame.draw.rect(overlay, (255,255,255, clamp(alpha,0,180)), overlay.get_rect())
+            overlay = STATIC_SURFACES['clear_overlay']
+            overlay.set_alpha(clamp(alpha, 0, 180))
             screen.blit(overlay, (MARGIN, MARGIN))
 
-    def draw_mini_mat(self, screen, kind, x, y, highlight=False):
-        rect = pygame.Rect(x, y, 96, 64)
-        pygame.draw.rect(screen, (36,40,48), rect, border_radius=10)
-        if highlight:
-            pygame.draw.rect(screen, (80,86,96), rect, width=2, border_radius=10)
-        if not kind:
-            return
-        # 画 4x4 缩略图
-        mat = SHAPES[kind][0]
-        # 计算居中缩放：mini cell
-        mini = 16
-        # 求其最小包围盒
-        coords = []
-        for i in range(16):
-            if mat[i]=='X':
-                r,c=i//4,i%4
-                coords.append((r,c))
-        if not coords:
-            return
-        minr=min(r for r,c in coords); maxr=max(r for r,c in coords)
-        minc=min(c for r,c in coords); maxc=max(c for r,c in coords)
-        w=(maxc-minc+1)*mini; h=(maxr-minr+1)*mini
-        ox = x + (rect.w - w)//2
-        oy = y + (rect.h - h)//2
-        col = PIECE_COLORS[kind]
-        for r,c in coords:
-            px = ox + (c - minc)*mini
-            py = oy + (r - minr)*mini
-            pygame.draw.rect(screen, col, (px+2, py+2, mini-4, mini-4), border_radius=5)
+    def draw_mini_mat(self, out, kind, x, y, highlight=False):
+        # 缩略图（含底板与高亮描边）已预渲染（见 render_mini）
+        out.append((MINI_SURFACES[(kind, highlight)], (x, y)))
 
     def draw_center_text(self, screen, text, size, color, sub=None):
-        font = get_font(size)
-        surf = font.render(text, True, color)
+        surf = render_text(text, size, color)
         rect = surf.get_rect(center=(WIN_W//2, WIN_H//2 - 20))
         screen.blit(surf, rect)
         if sub:
-            sfont = get_font(20)
-            ss = sfont.render(sub, True, MUTED)
+            ss = render_text(sub, 20, MUTED)
             srect = ss.get_rect(center=(WIN_W//2, WIN_H//2 + 18))
             screen.blit(ss, srect)
 
@@ -944,118 +1122,212 @@ def load_highscore():
     except Exception:
         return 0
 
+HS_LOCK = threading.Lock()  # 串行化写入：后台线程与同步写不会交错
+
 def save_highscore(val:int):
-    try:
-        with open(HS_FILE, 'w', encoding='utf-8') as f:
-            json.dump({'highscore': int(val)}, f)
-    except Exception:
-        pass
+    # 先写临时文件再 os.replace，中途崩溃也不会留下半截 JSON
+    tmp = HS_FILE + '.tmp'
+    with HS_LOCK:
+        try:
+            # 先序列化成完整字符串再一次写出（json.dump 会分多段调用 write）
+            data = json.dumps({'highscore': int(val)})
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp, HS_FILE)
+        except Exception:
+            pass
+
+def save_highscore_async(val:int, prev:threading.Thread|None=None)->threading.Thread:
+    # 在后台线程写盘，慢速磁盘不阻塞主循环；返回线程供退出前 join。
+    # 新线程先等上一次写入（prev）结束，保证按提交顺序落盘，join 最后一个即等齐全部
+    def run():
+        if prev is not None:
+            prev.join()
+        save_highscore(val)
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    return t
 
 # ===================== 主循环与输入 ===================== #
 
+# 窗口暴露/恢复/尺寸变化：脏矩形渲染据此强制整屏重画
+REPAINT_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                  pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
+# 对局内操作键：按键 -> 作用于 Game 的动作（一次字典查找代替 elif 链）
+KEY_ACTIONS = {
+    pygame.K_DOWN:  Game.soft_drop,
+    pygame.K_UP:    lambda g: g.try_rotate(+1),
+    pygame.K_x:     lambda g: g.try_rotate(+1),
+    pygame.K_z:     lambda g: g.try_rotate(-1),
+    pygame.K_a:     lambda g: g.try_rotate(2),
+    pygame.K_SPACE: Game.hard_drop,
+    pygame.K_c:     Game.hold_swap,
+}
+
+def open_window()->pygame.Surface:
+    # 设置环境变量 TETRIS_GPU=1 时改走 SDL Renderer（GPU 纹理上传 + 垂直同步）：
+    # SCALED 模式下 pygame 内部用 Renderer/Texture 呈现画面，绘制代码无需改动。
+    # 平台不支持时回退到默认的软件窗口。
+    if os.environ.get('TETRIS_GPU') == '1':
+        try:
+            return pygame.display.set_mode((WIN_W, WIN_H), pygame.SCALED, vsync=1)
+        except (pygame.error, TypeError):
+            pass
+    return pygame.display.set_mode((WIN_W, WIN_H))
+
 def main():
     pygame.init()
     pygame.display.set_caption('Tetris — 单文件完整版')
-    screen = pygame.display.set_mode((WIN_W, WIN_H))
+    screen = open_window()
     clock = pygame.time.Clock()
+    # 只让 SDL 投递需要处理的事件（鼠标/手柄等不再进入队列）；
+    # ←/→ 的按住重复通过 key.get_pressed() 轮询，SDL 内部键盘状态不受此过滤影响，故不需要 KEYUP
+    # 窗口被遮挡/恢复后内容可能损坏（无合成器时），需收到这些事件来整屏重画
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, *REPAINT_EVENTS])
 
     # 初始化中文字体，避免中文 UI 文字乱码
     global FONT_PATH
     FONT_PATH = match_cjk_font()
+    init_surfaces()
 
-    game = Game()
     high = load_highscore()
-
-    # 键盘自动重复处理（简化 DAS/ARR）
-    move_left = move_right = False
-    das_timer = 0.0
-    das_delay = 0.15
-    arr = 0.03
+    game = Game(high)
+    saved_high = high  # 已提交写盘的最高分，仅在超过它时才写文件
+    save_thread = None # 最近一次后台写盘线程，退出前须等它完成
+
+    # 横移（简化 DAS/ARR）：首格由 KEYDOWN 触发（短按不丢），按住重复每帧轮询一次按键状态
+    # 计时用整数毫秒，全程整数比较与整除
+    das_dir = 0      # 当前按住的方向：-1 左，1 右，0 无
+    das_ms = 0
+    das_delay_ms = 150
+    arr_ms = 30
+
+    # 顶部 HIGH 文字：仅在数值变化时重新取表面并算好右对齐位置
+    hud_hs = None
+    hud_surf = hud_pos = None
+    # 上一次提交到屏幕的分区状态（None 表示尚未绘制）
+    last_field = last_panel = None
+
+    # 循环内反复用到的模块属性先绑定为局部变量（LOAD_FAST 代替逐级属性查找）
+    perf_counter = time.perf_counter
+    event_get = pygame.event.get
+    get_pressed = pygame.key.get_pressed
+    display_update = pygame.display.update
+    QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+    repaint_events = frozenset(REPAINT_EVENTS)
+    K_LEFT, K_RIGHT = pygame.K_LEFT, pygame.K_RIGHT
 
     running = True
+    last = perf_counter()
     while running:
-        dt = clock.tick(FPS) / 1000.0
+        # 每帧只节流一次、只取一次事件队列；静止画面用更低帧率
+        # clock 只负责节流（部分平台精度约 10ms），dt 取自高精度 perf_counter
+        clock.tick(IDLE_FPS if game.paused or game.game_over else FPS)
+        now = perf_counter()
+        dt = min(now - last, MAX_DT)
+        # 毫秒差取自两端时间戳各自取整，逐帧截断误差不会累积
+        dt_ms = min(int(now * 1000) - int(last * 1000), int(MAX_DT * 1000))
+        last = now
 
         # 事件
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
+        for e in event_get():
+            if e.type == QUIT:
                 running = False
-            elif e.type == pygame.KEYDOWN:
+            elif e.type in repaint_events:
+                # 窗口内容需重建：下一帧两个分区都重画并提交
+                last_field = last_panel = None
+            elif e.type == KEYDOWN:
                 if e.key == pygame.K_ESCAPE:
                     running = False
                 if game.game_over:
                     if e.key == pygame.K_r:
                         # 保存高分
-                        high = max(high, game.score)
-                        save_highscore(high)
-                        game = Game()
+                        high = game.high
+                        if high > saved_high:
+                            save_thread = save_highscore_async(high, save_thread)
+                            saved_high = high
+                        game = Game(high)
                         continue
                 else:
                     if e.key == pygame.K_p:
                         game.paused = not game.paused
                     if game.paused:
                         continue
-                # 操作
-                if e.key == pygame.K_LEFT:
-                    move_left = True; das_timer = 0
-                    game.try_move(-1, 0)
-                elif e.key == pygame.K_RIGHT:
-                    move_right = True; das_timer = 0
-                    game.try_move(1, 0)
-                elif e.key == pygame.K_DOWN:
-                    game.soft_drop()
-                elif e.key in (pygame.K_UP, pygame.K_x):
-                    game.try_rotate(+1)
-                elif e.key == pygame.K_z:
-                    game.try_rotate(-1)
-                elif e.key == pygame.K_a:
-                    game.try_rotate(2)
-                elif e.key == pygame.K_SPACE:
-                    game.hard_drop()
-                elif e.key == pygame.K_c:
-                    game.hold_swap()
+                # 操作（见 KEY_ACTIONS；←/→ 首格在此移动，按住重复由下方轮询处理）
+                action = KEY_ACTIONS.get(e.key)
+                if action is not None:
+                    action(game)
+                elif e.key in (K_LEFT, K_RIGHT):
+                    if not game.game_over:
+                        das_dir, das_ms = (-1 if e.key == K_LEFT else 1), 0
+                        game.try_move(das_dir, 0)
                 elif e.key == pygame.K_r and not game.game_over:
-                    high = max(high, game.score)
-                    save_highscore(high)
-                    game = Game()
-            elif e.type == pygame.KEYUP:
-                if e.key == pygame.K_LEFT:
-                    move_left = False
-                elif e.key == pygame.K_RIGHT:
-                    move_right = False
-
-        # 横移重复（DAS/ARR 简化）
-        if not game.paused and not game.game_over:
-            if move_left or move_right:
-                das_timer += dt
-                if das_timer >= das_delay:
-                    # 执行 ARR
-                    while das_timer >= arr + das_delay:
-                        das_timer -= arr
-                        if move_left and not move_right:
-                            game.try_move(-1, 0)
-                        elif move_right and not move_left:
-                            game.try_move(1, 0)
+                    high = game.high
+                    if high > saved_high:
+                        save_thread = save_highscore_async(high, save_thread)
+                        saved_high = high
+                    game = Game(high)
+
+        # 横移（DAS/ARR 简化）：按住超过 das_delay_ms 后每 arr_ms 一格；同时按住左右则不动。
+        # 首格已在 KEYDOWN 中移动；这里只在方向改变却没有对应 KEYDOWN 时补一格
+        # （如先松开了另一侧的键）
+        # 事件处理之后 game 对象及暂停/结束状态在本帧剩余部分内只读，取一次即可
+        over = game.game_over
+        active = not (game.paused or over)
+        keys = get_pressed()
+        dx = keys[K_RIGHT] - keys[K_LEFT]
+        if dx and active:
+            if dx != das_dir:
+                das_dir, das_ms = dx, 0
+                game.try_move(dx, 0)
             else:
-                das_timer = 0
+                das_ms += dt_ms
+                # 直接算出本帧应重复的格数，撞墙即停（之后的尝试必然失败）
+                n = (das_ms - das_delay_ms) // arr_ms
+                if n > 0:
+                    das_ms -= n * arr_ms
+                    for _ in range(n):
+                        if not game.try_move(dx, 0):
+                            break
+        else:
+            das_dir, das_ms = 0, 0
 
-        if not game.game_over:
+        if not over:
             game.update(dt)
 
-        # 绘制
-        game.draw(screen)
-
-        # 顶部显示高分（使用中文兼容字体渲染）
-        font = get_font(16)
-        hs = max(high, game.score)
-        info = font.render(f"HIGH {hs}", True, (200, 205, 214))
-        screen.blit(info, (WIN_W - PANEL_W - 20 - info.get_width(), 6))
-
-        pygame.display.flip()
-
-    # 退出保存高分
-    high = max(high, game.score)
-    save_highscore(high)
+        # 绘制：只重画并提交状态有变化的分区
+        hs = game.high
+        field, panel = game.field_state() + (hs,), game.panel_state()
+        dirty = []
+        if field != last_field:
+            dirty.append(FIELD_RECT)
+        if panel != last_panel:
+            dirty.append(PANEL_RECT)
+        last_field, last_panel = field, panel
+        if dirty:
+            if len(dirty) == 1:
+                screen.set_clip(dirty[0])
+            game.draw(screen)
+
+            # 顶部显示高分（使用中文兼容字体渲染）
+            if hs != hud_hs:
+                hud_hs = hs
+                hud_surf = render_text(f"HIGH {hs}", 16, (200, 205, 214))
+                hud_pos = (WIN_W - PANEL_W - 20 - hud_surf.get_width(), 6)
+            screen.blit(hud_surf, hud_pos)
+
+            screen.set_clip(None)
+            display_update(dirty)
+
+    # 退出保存高分：daemon 线程会随进程退出被直接杀掉，先 join 等后台写入完成，
+    # 本局若又刷新了纪录再同步写一次
+    if save_thread is not None:
+        save_thread.join()
+    high = game.high
+    if high > saved_high:
+        save_highscore(high)
     pygame.quit()
     sys.exit()
 